@@ -5,7 +5,7 @@ Racing Game - Simple and Fun with Working Collisions
 import time
 import random
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 @dataclass
@@ -63,11 +63,13 @@ class RacingGame:
         self.last_update = time.time()
         self.road_offset = 0.0
         
-    def update(self, steering: float, speed_input: float, nitro_input: float = 0) -> Dict:
-        """Update game state"""
-        current = time.time()
-        dt = min(current - self.last_update, 0.1)
-        self.last_update = current
+    def update(self, steering: float, speed_input: float, nitro_input: float = 0,
+               dt: Optional[float] = None) -> Dict:
+        """Update game state; fixed dt if given, else wall-clock"""
+        if dt is None:
+            current = time.time()
+            dt = min(current - self.last_update, 0.1)
+            self.last_update = current
         
         if self.game_over:
             return self.get_state()
@@ -0,0 +1,87 @@
+"""
+Fixed-rate game tick scheduler - physics runs independently of the camera
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from .game_logic import RacingGame
+
+
+class GameScheduler:
+    """Runs RacingGame ticks at a fixed rate on its own asyncio task.
+
+    Hand detection publishes control values with ``set_control`` at whatever
+    rate it manages; every tick consumes the latest one and advances the game
+    by exactly ``1 / tick_rate`` seconds.
+    """
+
+    def __init__(self, game: RacingGame, tick_rate: float = 60.0, max_catchup: int = 5):
+        self.game = game
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate
+        self.max_catchup = max_catchup  # Max ticks run per wake-up after a stall
+
+        self.control = {'steering': 0.0, 'speed': 0.0, 'nitro': 0.0}
+        self.state: Dict = game.get_state()
+        self.ticks = 0
+
+        self._task: Optional[asyncio.Task] = None
+
+    def set_control(self, control: Dict):
+        """Publish the latest fuzzy controller output"""
+        self.control = {
+            'steering': float(control['steering']),
+            'speed': float(control['speed']),
+            'nitro': float(control['nitro'])
+        }
+
+    def reset(self):
+        """Clear pending control and refresh the cached state"""
+        self.control = {'steering': 0.0, 'speed': 0.0, 'nitro': 0.0}
+        self.state = self.game.get_state()
+
+    def tick(self) -> Dict:
+        """Advance the game by one fixed step"""
+        self.state = self.game.update(
+            self.control['steering'],
+            self.control['speed'],
+            self.control['nitro'],
+            dt=self.tick_dt
+        )
+        self.ticks += 1
+        return self.state
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def advance(self, now: float, next_tick: float) -> float:
+        """Run the ticks due at ``now`` and return when the next one is due"""
+        # Run every tick that is due, but drop backlog after a long stall
+        # instead of trying to replay it all at once.
+        steps = 0
+        while now >= next_tick and steps < self.max_catchup:
+            self.tick()
+            next_tick += self.tick_dt
+            steps += 1
+        if steps == self.max_catchup:
+            next_tick = max(next_tick, now + self.tick_dt)
+        return next_tick
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        while True:
+            next_tick = self.advance(loop.time(), next_tick)
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
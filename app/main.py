@@ -10,10 +10,12 @@ import cv2
 import base64
 import numpy as np
 import asyncio
+import threading
 
 from .hand_detector import HandDetector
 from .fuzzy_controller import FuzzySteeringController
 from .game_logic import RacingGame
+from .game_scheduler import GameScheduler
 
 app = FastAPI(title="Fuzzy Racing Game API")
 
@@ -33,6 +35,24 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 detector = HandDetector(max_hands=2, detection_confidence=0.6)
 controller = FuzzySteeringController()
 game = RacingGame()
+scheduler = GameScheduler(game, tick_rate=60.0)
+
+STATE_RATE = 30.0  # State messages per second sent to the client
+
+# Detector and controller are shared and not thread-safe: every detect,
+# compute and reset runs under this lock.
+pipeline_lock = threading.Lock()
+pipeline_generation = 0  # Bumped on reset so control computed before it is dropped
+active_connections = 0
+
+
+def reset_pipeline(reset_detector: bool = True):
+    global pipeline_generation
+    with pipeline_lock:
+        pipeline_generation += 1
+        controller.reset()
+        if reset_detector:
+            detector.reset()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -52,16 +72,18 @@ async def health():
 
 @app.post("/start")
 async def start():
+    await asyncio.to_thread(reset_pipeline)
+    # No await between these so no tick sees a half-reset game
     game.reset()
-    controller.reset()
-    detector.reset()
+    scheduler.reset()
     return {"status": "started"}
 
 
 @app.post("/reset")
 async def reset():
+    await asyncio.to_thread(reset_pipeline, False)
     game.reset()
-    controller.reset()
+    scheduler.reset()
     return {"status": "reset"}
 
 
@@ -89,63 +111,116 @@ async def game_ws(websocket: WebSocket):
     
     await websocket.send_json({"status": "connected"})
     
-    frame_count = 0
+    global active_connections
+    loop = asyncio.get_running_loop()
+    stop_event = threading.Event()
     
-    try:
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                await asyncio.sleep(0.01)
-                continue
+    # Latest detection results, shared with the sender task
+    latest = {
+        'frame': None,
+        'angle': 0.0,
+        'hands': 0,
+        'gesture': 0,
+        'control': dict(scheduler.control)
+    }
+    
+    def publish(generation, frame_b64, angle, hands, gesture, control):
+        # Drop results that arrive after the session ended or a reset
+        if stop_event.is_set() or generation != pipeline_generation:
+            return
+        scheduler.set_control(control)
+        if frame_b64 is not None:
+            latest['frame'] = frame_b64
+        latest['angle'] = float(angle)
+        latest['hands'] = int(hands)
+        latest['gesture'] = int(gesture)
+        latest['control'] = dict(scheduler.control)
+    
+    def camera_worker():
+        """Capture and detection loop; owns `cap` and releases it on exit"""
+        frame_count = 0
+        try:
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    stop_event.wait(0.01)
+                    continue
                 
-            frame = cv2.flip(frame, 1)
-            
-            # Detect hands
-            frame, angle, hands, gesture, conf, openness = detector.detect(frame)
-            
-            # Compute fuzzy control
-            control = controller.compute(angle, hands, gesture)
-            
-            # Update game
-            game_state = game.update(
-                control['steering'],
-                control['speed'],
-                control['nitro']
-            )
-            
-            # Encode frame (every other frame)
-            frame_count += 1
-            if frame_count % 2 == 0:
-                small_frame = cv2.resize(frame, (320, 240))
-                _, buffer = cv2.imencode('.jpg', small_frame, 
-                                        [cv2.IMWRITE_JPEG_QUALITY, 65])
-                frame_b64 = base64.b64encode(buffer).decode('utf-8')
-            else:
-                frame_b64 = None
-            
+                frame = cv2.flip(frame, 1)
+                
+                with pipeline_lock:
+                    # Detect hands
+                    frame, angle, hands, gesture, conf, openness = detector.detect(frame)
+                    
+                    # Compute fuzzy control
+                    control = controller.compute(angle, hands, gesture)
+                    generation = pipeline_generation
+                
+                # Encode frame (every other frame)
+                frame_count += 1
+                if frame_count % 2 == 0:
+                    small_frame = cv2.resize(frame, (320, 240))
+                    _, buffer = cv2.imencode('.jpg', small_frame, 
+                                            [cv2.IMWRITE_JPEG_QUALITY, 65])
+                    frame_b64 = base64.b64encode(buffer).decode('utf-8')
+                else:
+                    frame_b64 = None
+                
+                if not stop_event.is_set():
+                    loop.call_soon_threadsafe(publish, generation, frame_b64,
+                                              angle, hands, gesture, control)
+        finally:
+            cap.release()
+    
+    async def send_loop():
+        while True:
             # Send response
             response = {
-                'frame': frame_b64,
-                'angle': float(angle),
-                'hands': int(hands),
-                'gesture': int(gesture),
-                'control': {
-                    'steering': float(control['steering']),
-                    'speed': float(control['speed']),
-                    'nitro': float(control['nitro'])
-                },
-                'game': game_state
+                'frame': latest['frame'],
+                'angle': latest['angle'],
+                'hands': latest['hands'],
+                'gesture': latest['gesture'],
+                'control': latest['control'],
+                'game': scheduler.state
             }
+            latest['frame'] = None  # Each frame is sent once
             
             await websocket.send_json(response)
-            await asyncio.sleep(0.025)  # ~40 FPS
-            
+            await asyncio.sleep(1.0 / STATE_RATE)
+    
+    active_connections += 1
+    scheduler.start()
+    
+    # Detection runs in its own thread so game ticks stay on time
+    camera_task = asyncio.create_task(asyncio.to_thread(camera_worker))
+    send_task = asyncio.create_task(send_loop())
+    
+    try:
+        await asyncio.wait({camera_task, send_task}, return_when=asyncio.FIRST_COMPLETED)
+        if send_task.done():
+            send_task.result()
+        else:
+            # The camera thread only exits on its own when it fails:
+            # drop its last control value and end the session.
+            error = camera_task.exception()
+            print(f"Camera error: {error}")
+            scheduler.reset()
+            await websocket.send_json({"error": f"Camera error: {error}"})
     except WebSocketDisconnect:
         pass
     except Exception as e:
         print(f"WebSocket error: {e}")
     finally:
-        cap.release()
+        stop_event.set()
+        send_task.cancel()
+        # Wait for the worker so the camera is released before returning
+        try:
+            await camera_task
+        except Exception:
+            pass
+        active_connections -= 1
+        if active_connections == 0:
+            await scheduler.stop()
 
 
 if __name__ == "__main__":
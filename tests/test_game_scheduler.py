@@ -0,0 +1,92 @@
+"""
+Tests for the fixed-rate game tick scheduler
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.game_logic import RacingGame
+from app.game_scheduler import GameScheduler
+
+
+def test_tick_advances_by_fixed_dt():
+    scheduler = GameScheduler(RacingGame(), tick_rate=60.0)
+
+    time.sleep(0.05)  # Wall-clock time must not leak into the step
+    scheduler.tick()
+    assert scheduler.state['game_time'] == pytest.approx(scheduler.tick_dt)
+
+    scheduler.tick()
+    assert scheduler.state['game_time'] == pytest.approx(2 * scheduler.tick_dt)
+    assert scheduler.ticks == 2
+
+
+def test_set_control_used_by_next_tick():
+    scheduler = GameScheduler(RacingGame(), tick_rate=60.0)
+
+    scheduler.set_control({'steering': 100.0, 'speed': 100.0, 'nitro': 0.0})
+    scheduler.tick()
+    assert scheduler.state['player_x'] == pytest.approx(1.5 * scheduler.tick_dt)
+    assert scheduler.state['speed'] == pytest.approx(80 * scheduler.tick_dt)
+
+    scheduler.reset()
+    assert scheduler.control == {'steering': 0.0, 'speed': 0.0, 'nitro': 0.0}
+
+
+def test_start_twice_runs_one_loop():
+    async def run():
+        once = GameScheduler(RacingGame(), tick_rate=100.0)
+        twice = GameScheduler(RacingGame(), tick_rate=100.0)
+        once.start()
+        twice.start()
+        twice.start()
+        await asyncio.sleep(0.1)
+        await once.stop()
+        await twice.stop()
+
+        # A second loop would roughly double the tick count
+        assert once.ticks > 0
+        assert twice.ticks <= once.ticks + 3
+
+    asyncio.run(run())
+
+
+def test_stop_stops_ticking():
+    async def run():
+        scheduler = GameScheduler(RacingGame(), tick_rate=200.0)
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+        assert scheduler.ticks > 0
+
+        ticks = scheduler.ticks
+        await asyncio.sleep(0.05)
+        assert scheduler.ticks == ticks
+
+    asyncio.run(run())
+
+
+def test_advance_runs_due_ticks():
+    scheduler = GameScheduler(RacingGame(), tick_rate=100.0, max_catchup=5)
+
+    next_tick = scheduler.advance(0.035, 0.0)  # Ticks due at 0, 10, 20 and 30 ms
+    assert scheduler.ticks == 4
+    assert next_tick == pytest.approx(0.04)
+
+    assert scheduler.advance(0.039, next_tick) == next_tick
+    assert scheduler.ticks == 4
+
+
+def test_advance_limits_catchup_after_stall():
+    scheduler = GameScheduler(RacingGame(), tick_rate=100.0, max_catchup=3)
+
+    next_tick = scheduler.advance(1.0, 0.0)  # 100 ticks due
+    assert scheduler.ticks == 3
+    assert scheduler.state['game_time'] == pytest.approx(3 * scheduler.tick_dt)
+
+    # The missed time is dropped, not replayed on the next wake-up
+    assert next_tick == pytest.approx(1.0 + scheduler.tick_dt)
+    scheduler.advance(1.0 + scheduler.tick_dt, next_tick)
+    assert scheduler.ticks == 4